@@ -1,7 +1,15 @@
 import collections
+import itertools
 
 import ayon_api
 
+# Next version for values used by 'get_last_versions_for_instances' when
+#   'use_value_for_missing' is enabled
+_NEXT_VERSION_BY_MISSING_VALUE = {
+    -2: None,
+    -1: 1,
+}
+
 
 def get_last_versions_for_instances(
     project_name, instances, use_value_for_missing=False
@@ -42,56 +50,54 @@ def get_last_versions_for_instances(
         )
         product_names_by_folder_path[folder_path].add(product_name)
 
-    product_names = set()
-    for names in product_names_by_folder_path.values():
-        product_names |= names
+    product_names = set(itertools.chain.from_iterable(
+        product_names_by_folder_path.values()
+    ))
 
     if not product_names:
         return output
 
     folder_entities = ayon_api.get_folders(
         project_name,
-        folder_paths=product_names_by_folder_path.keys(),
+        folder_paths=list(product_names_by_folder_path),
         fields={"id", "path"}
     )
-    folder_paths_by_id = {
-        folder_entity["id"]: folder_entity["path"]
-        for folder_entity in folder_entities
-    }
-    if not folder_paths_by_id:
+    instances_by_folder_id = {}
+    for folder_entity in folder_entities:
+        # Returned path may differ from requested path (e.g. missing
+        #   leading slash), skip folders that don't match any instance
+        folder_instances = instances_by_hierarchy.get(folder_entity["path"])
+        if folder_instances is not None:
+            instances_by_folder_id[folder_entity["id"]] = folder_instances
+    if not instances_by_folder_id:
         return output
 
     product_entities = ayon_api.get_products(
         project_name,
-        folder_ids=folder_paths_by_id.keys(),
-        product_names=product_names,
+        folder_ids=list(instances_by_folder_id),
+        product_names=list(product_names),
         fields={"id", "name", "folderId"}
     )
-    product_entities_by_id = {}
+    instances_by_product_id = {}
     for product_entity in product_entities:
         # Filter product entities by names under parent
         folder_id = product_entity["folderId"]
         product_name = product_entity["name"]
-        folder_path = folder_paths_by_id[folder_id]
-        if product_name not in product_names_by_folder_path[folder_path]:
+        _instances = instances_by_folder_id[folder_id].get(product_name)
+        if _instances is None:
             continue
-        product_entities_by_id[product_entity["id"]] = product_entity
+        instances_by_product_id[product_entity["id"]] = _instances
 
-    if not product_entities_by_id:
+    if not instances_by_product_id:
         return output
 
     last_versions_by_product_id = ayon_api.get_last_versions(
         project_name,
-        product_entities_by_id.keys(),
+        list(instances_by_product_id),
         fields={"version", "productId"}
     )
     for product_id, version_entity in last_versions_by_product_id.items():
-        product_entity = product_entities_by_id[product_id]
-        product_name = product_entity["name"]
-        folder_id = product_entity["folderId"]
-        folder_path = folder_paths_by_id[folder_id]
-        _instances = instances_by_hierarchy[folder_path][product_name]
-        for instance in _instances:
+        for instance in instances_by_product_id[product_id]:
             output[instance.id] = version_entity["version"]
 
     return output
@@ -112,12 +118,11 @@ def get_next_versions_for_instances(project_name, instances):
     last_versions = get_last_versions_for_instances(
         project_name, instances, True)
 
-    output = {}
-    for instance_id, version in last_versions.items():
-        if version == -2:
-            output[instance_id] = None
-        elif version == -1:
-            output[instance_id] = 1
-        else:
-            output[instance_id] = version + 1
-    return output
+    return {
+        instance_id: (
+            _NEXT_VERSION_BY_MISSING_VALUE[version]
+            if version in _NEXT_VERSION_BY_MISSING_VALUE
+            else version + 1
+        )
+        for instance_id, version in last_versions.items()
+    }
@@ -106,15 +106,12 @@ def check_destination_path(
         ).format(template_name or template_str)
     ### Ends Alkemy-X Override ###
 
-        sub_msg = (
-            "Representation: {}<br>"
-        ).format(repre_id)
+        # Items are plain text, they're escaped when the report is rendered
+        sub_msgs = ["Representation: {}".format(repre_id)]
 
         if dest_path.missing_keys:
             keys = ", ".join(dest_path.missing_keys)
-            sub_msg += (
-                "- Missing keys: \"{}\"<br>"
-            ).format(keys)
+            sub_msgs.append("- Missing keys: \"{}\"".format(keys))
 
         if dest_path.invalid_types:
             items = []
@@ -122,11 +119,11 @@ def check_destination_path(
                 items.append("\"{}\" {}".format(key, str(value)))
 
             keys = ", ".join(items)
-            sub_msg += (
-                "- Invalid value DataType: \"{}\"<br>"
-            ).format(keys)
+            sub_msgs.append(
+                "- Invalid value DataType: \"{}\"".format(keys)
+            )
 
-        report_items[msg].append(sub_msg)
+        report_items[msg].extend(sub_msgs)
 
     ### Starts Alkemy-X Override ###
     if return_dest_path:
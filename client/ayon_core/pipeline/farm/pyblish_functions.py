@@ -1,7 +1,9 @@
 import copy
 import os
+import pickle
 import re
 import warnings
+import weakref
 import datetime
 from copy import deepcopy
 
@@ -26,6 +28,36 @@ class TimeData(object):
     handle_end = attr.ib(default=0, type=int)
 
 
+# Rootless paths found by anatomy roots, cached for lifetime of anatomy object
+_ROOTLESS_PATHS_BY_ANATOMY = weakref.WeakKeyDictionary()
+
+
+def _find_root_template_from_path(anatomy, path):
+    """Cached variant of 'Anatomy.find_root_template_from_path'.
+
+    Staging directories are mostly shared across representations and
+    instances, so roots are matched only once per unique path. Only
+    successful matches are cached so failures are still logged by roots.
+
+    Args:
+        anatomy (Anatomy): Anatomy object used for the lookup.
+        path (str): Path where root should be found.
+
+    Returns:
+        tuple[bool, str]: Success and path with or without replaced root.
+
+    """
+    rootless_paths = _ROOTLESS_PATHS_BY_ANATOMY.setdefault(anatomy, {})
+    rootless_path = rootless_paths.get(path)
+    if rootless_path is not None:
+        return True, rootless_path
+
+    success, rootless_path = anatomy.find_root_template_from_path(path)
+    if success:
+        rootless_paths[path] = rootless_path
+    return success, rootless_path
+
+
 def remap_source(path, anatomy):
     """Try to remap path to rootless path.
 
@@ -42,7 +74,7 @@ def remap_source(path, anatomy):
 
     """
     success, rootless_path = (
-        anatomy.find_root_template_from_path(path)
+        _find_root_template_from_path(anatomy, path)
     )
     if success:
         source = rootless_path
@@ -201,7 +233,7 @@ def create_skeleton_instance(
 
     source = data.get("source") or context.data.get("currentFile")
     success, rootless_path = (
-        anatomy.find_root_template_from_path(source)
+        _find_root_template_from_path(anatomy, source)
     )
     if success:
         source = rootless_path
@@ -299,6 +331,24 @@ def _add_review_families(families):
     return families
 
 
+def _get_collection_file_names(collection_files):
+    """Get file names of files from one collection.
+
+    All files of a clique collection share the same head, so the directory
+    is stripped by slicing instead of calling 'os.path.basename' per file.
+
+    Args:
+        collection_files (list[str]): Paths of files in a collection.
+
+    Returns:
+        list[str]: File names without directory.
+
+    """
+    first_file = collection_files[0]
+    dirname_len = len(first_file) - len(os.path.basename(first_file))
+    return [filepath[dirname_len:] for filepath in collection_files]
+
+
 def prepare_representations(skeleton_data, exp_files, anatomy, aov_filter,
                             skip_integration_repre_list,
                             do_not_add_review,
@@ -332,6 +382,7 @@ def prepare_representations(skeleton_data, exp_files, anatomy, aov_filter,
     # create representation for every collected sequence
     for collection in collections:
         ext = collection.tail.lstrip(".")
+        collection_files = list(collection)
         preview = False
         # TODO 'useSequenceForReview' is temporary solution which does
         #   not work for 100% of cases. We must be able to tell what
@@ -346,16 +397,16 @@ def prepare_representations(skeleton_data, exp_files, anatomy, aov_filter,
                 )
                 preview = True
             else:
-                render_file_name = list(collection)[0]
+                render_file_name = collection_files[0]
                 # if filtered aov name is found in filename, toggle it for
                 # preview video rendering
                 preview = match_aov_pattern(
                     host_name, aov_filter, render_file_name
                 )
 
-        staging = os.path.dirname(list(collection)[0])
+        staging = os.path.dirname(collection_files[0])
         success, rootless_staging_dir = (
-            anatomy.find_root_template_from_path(staging)
+            _find_root_template_from_path(anatomy, staging)
         )
         if success:
             staging = rootless_staging_dir
@@ -391,7 +442,7 @@ def prepare_representations(skeleton_data, exp_files, anatomy, aov_filter,
             "name": repre_name,
         ### Ends Alkemy-X Override ###
             "ext": ext,
-            "files": [os.path.basename(f) for f in list(collection)],
+            "files": _get_collection_file_names(collection_files),
             "frameStart": frame_start,
             "frameEnd": int(skeleton_data.get("frameEndHandle")),
             # If expectedFile are absolute, we need only filenames
@@ -424,7 +475,7 @@ def prepare_representations(skeleton_data, exp_files, anatomy, aov_filter,
 
         staging = os.path.dirname(remainder)
         success, rootless_staging_dir = (
-            anatomy.find_root_template_from_path(staging)
+            _find_root_template_from_path(anatomy, staging)
         )
         if success:
             staging = rootless_staging_dir
@@ -702,6 +753,10 @@ def _create_instances_for_aov(instance, skeleton, aov_filter, additional_data,
     expected_files = instance.data["expectedFiles"]
     log = Logger.get_logger("farm_publishing")
 
+    # Serialize skeleton only once, unpickling it for each AOV is
+    #   considerably faster than 'deepcopy'
+    skeleton_dump = pickle.dumps(skeleton, pickle.HIGHEST_PROTOCOL)
+
     instances = []
     # go through AOVs in expected files
     for aov, files in expected_files[0].items():
@@ -775,7 +830,7 @@ def _create_instances_for_aov(instance, skeleton, aov_filter, additional_data,
 
         preview = match_aov_pattern(app, aov_patterns, render_file_name)
 
-        new_instance = deepcopy(skeleton)
+        new_instance = pickle.loads(skeleton_dump)
         new_instance["productName"] = product_name
         new_instance["productGroup"] = group_name
         new_instance["aov"] = aov
@@ -988,7 +1043,7 @@ def create_skeleton_instance_cache(instance):
 
     source = data.get("source") or context.data.get("currentFile")
     success, rootless_path = (
-        anatomy.find_root_template_from_path(source)
+        _find_root_template_from_path(anatomy, source)
     )
     if success:
         source = rootless_path
@@ -1064,10 +1119,11 @@ def prepare_cache_representations(skeleton_data, exp_files, anatomy):
     # create representation for every collected sequence
     for collection in collections:
         ext = collection.tail.lstrip(".")
+        collection_files = list(collection)
 
-        staging = os.path.dirname(list(collection)[0])
+        staging = os.path.dirname(collection_files[0])
         success, rootless_staging_dir = (
-            anatomy.find_root_template_from_path(staging)
+            _find_root_template_from_path(anatomy, staging)
         )
         if success:
             staging = rootless_staging_dir
@@ -1081,7 +1137,7 @@ def prepare_cache_representations(skeleton_data, exp_files, anatomy):
         rep = {
             "name": ext,
             "ext": ext,
-            "files": [os.path.basename(f) for f in list(collection)],
+            "files": _get_collection_file_names(collection_files),
             "frameStart": frame_start,
             "frameEnd": int(skeleton_data.get("frameEndHandle")),
             # If expectedFile are absolute, we need only filenames
@@ -1333,8 +1389,8 @@ def create_metadata_path(instance, anatomy):
     metadata_path = os.path.join(output_dir, metadata_filename)
 
     # Convert output dir to `{root}/rest/of/path/...` with Anatomy
-    success, rootless_mtdt_p = anatomy.find_root_template_from_path(
-        metadata_path)
+    success, rootless_mtdt_p = _find_root_template_from_path(
+        anatomy, metadata_path)
     if not success:
         # `rootless_path` is not set to `output_dir` if none of roots match
         log.warning((
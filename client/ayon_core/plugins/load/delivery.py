@@ -1,4 +1,5 @@
 import copy
+import html
 import platform
 from collections import defaultdict
 
@@ -375,16 +376,21 @@ class DeliveryOptionsDialog(QtWidgets.QDialog):
         self.progress_bar.setValue(ratio * self.progress_bar.maximum())
 
     def _format_report(self, report_items):
-        """Format final result and error details as html."""
+        """Format final result and error details as html.
+
+        Report headers and items are plain text and are escaped here.
+        """
         msg = "Delivery finished"
         if not report_items:
             msg += " successfully"
         else:
             msg += " with errors"
-        txt = "<h2>{}</h2>".format(msg)
+        parts = ["<h2>{}</h2>".format(msg)]
         for header, data in report_items.items():
-            txt += "<h3>{}</h3>".format(header)
-            for item in data:
-                txt += "{}<br>".format(item)
+            parts.append("<h3>{}</h3>".format(html.escape(str(header))))
+            parts.extend(
+                "{}<br>".format(html.escape(str(item)))
+                for item in data
+            )
 
-        return txt
+        return "".join(parts)